@@ -1,15 +1,23 @@
 """freshbooks Authentication."""
 from singer_sdk.authenticators import APIAuthenticatorBase
 from singer_sdk.streams import Stream as RESTStreamBase
-from typing import Optional
-from datetime import datetime
+from typing import ClassVar, Optional
 import requests
 import json
+import logging
+import orjson
+import os
+import stat
+import tempfile
+import time
 
 
 class BearerTokenAuthenticator(APIAuthenticatorBase):
     """API Authenticator for OAuth 2.0 flows."""
 
+    # shared across instances so token refreshes reuse pooled connections
+    _auth_session: ClassVar[requests.Session] = requests.Session()
+
     def __init__(
         self,
         stream: RESTStreamBase,
@@ -21,6 +29,12 @@ class BearerTokenAuthenticator(APIAuthenticatorBase):
         self._config_file = config_file
         self._tap = stream._tap
         self.expires_in = self._tap.config.get("expires_in", 0)
+        # monotonic deadline until which the current token is known to be valid
+        self._valid_until = 0.0
+        # auth headers built once per token, see `_build_auth_headers`
+        self._cached_headers = None
+        # no forced refreshes after a 401 until this monotonic time
+        self._refresh_cooldown_until = 0.0
 
     @property
     def auth_headers(self) -> dict:
@@ -33,11 +47,32 @@ class BearerTokenAuthenticator(APIAuthenticatorBase):
         """
         if not self.is_token_valid():
             self.update_access_token()
-        result = super().auth_headers
-        result[
-            "Authorization"
-        ] = f"Bearer {self._tap._config.get('access_token')}"
-        return result
+        if self._cached_headers is None:
+            self._build_auth_headers()
+        return self._cached_headers
+
+    def _build_auth_headers(self) -> None:
+        """Build the auth headers for the current access token."""
+        headers = dict(super().auth_headers)
+        headers["Authorization"] = f"Bearer {self._tap._config.get('access_token')}"
+        self._cached_headers = headers
+
+    def handle_unauthorized(self, sent_authorization: Optional[str]) -> bool:
+        """Refresh the token after a 401, at most once per cooldown window.
+
+        Returns:
+            True if the request should be retried with the current headers.
+        """
+        if self._cached_headers and (
+            self._cached_headers.get("Authorization") != sent_authorization
+        ):
+            # token was already rotated since the request was prepared
+            return True
+        if time.monotonic() < self._refresh_cooldown_until:
+            return False
+        self._refresh_cooldown_until = time.monotonic() + 1.0
+        self.update_access_token()
+        return True
 
     @property
     def auth_endpoint(self) -> str:
@@ -63,12 +98,18 @@ class BearerTokenAuthenticator(APIAuthenticatorBase):
         }
 
     def is_token_valid(self) -> bool:
-        now = round(datetime.utcnow().timestamp())
+        if time.monotonic() < self._valid_until:
+            return True
+
+        now = round(time.time())
         created_at = self._tap._config.get(
             "created_at", 0
         )
-
-        return now < (created_at + self.expires_in - 60)
+        remaining = created_at + self.expires_in - 60 - now
+        if remaining > 0:
+            self._valid_until = time.monotonic() + remaining
+            return True
+        return False
 
     # Authentication and refresh
     def update_access_token(self) -> None:
@@ -78,22 +119,57 @@ class BearerTokenAuthenticator(APIAuthenticatorBase):
             RuntimeError: When OAuth login fails.
         """
         auth_request_payload = self.request_body
-        token_response = requests.post(self.auth_endpoint, data=auth_request_payload)
+        token_response = self._auth_session.post(
+            self.auth_endpoint, data=auth_request_payload, timeout=(5, 30)
+        )
         try:
-            token_last_refreshed = round(datetime.utcnow().timestamp())
+            token_last_refreshed = round(time.time())
             token_response.raise_for_status()
             self.logger.info("OAuth authorization attempt was successful.")
-            token_json = token_response.json()
+            token_json = orjson.loads(token_response.content)
             token = token_json["data"]["token"]
         except Exception as ex:
+            if self.logger.isEnabledFor(logging.ERROR):
+                self.logger.error(f"Response content: {token_response.text}")
             raise RuntimeError(
-                f"Failed login, response was '{token_response.json()}'. {ex}"
-            )
+                f"Failed login, status code {token_response.status_code}. {ex}"
+            ) from ex
         self.access_token = token["jwt_token"]
         self.expires_in = token["expires_in"]
+        self._valid_until = time.monotonic() + self.expires_in - 60
 
         self._tap._config["created_at"] = token_last_refreshed
         self._tap._config["access_token"] = self.access_token
         self._tap._config["expires_in"] = self.expires_in
-        with open(self._tap.config_file, "w") as outfile:
-            json.dump(self._tap._config, outfile, indent=4)
+        self._build_auth_headers()
+        self._write_config()
+
+    def _write_config(self) -> None:
+        """Persist the token to the config file via temp file + rename."""
+        # resolve symlinks so the link target is updated, not the link itself
+        config_file = os.path.realpath(self._tap.config_file)
+        try:
+            fd, tmp_path = tempfile.mkstemp(
+                dir=os.path.dirname(config_file), suffix=".tmp"
+            )
+        except OSError:
+            # the directory isn't writable (e.g. a mounted secret), so fall
+            # back to rewriting the file in place
+            with open(config_file, "w") as outfile:
+                json.dump(self._tap._config, outfile, indent=4)
+            return
+        try:
+            try:
+                outfile = os.fdopen(fd, "w")
+            except BaseException:
+                os.close(fd)
+                raise
+            with outfile:
+                json.dump(self._tap._config, outfile, indent=4)
+            # mkstemp creates the file as 0600, keep the original mode instead
+            if os.path.exists(config_file):
+                os.chmod(tmp_path, stat.S_IMODE(os.stat(config_file).st_mode))
+            os.replace(tmp_path, config_file)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
@@ -1,16 +1,84 @@
 """REST client handling, including EasyEcomStream base class."""
-from typing import Callable
-from singer_sdk.exceptions import RetriableAPIError
-from urllib.parse import urlparse, parse_qs
+from typing import Callable, Iterable, Optional
+from urllib.parse import unquote_plus
+from concurrent.futures import ThreadPoolExecutor
 from functools import cached_property
+import copy
+import re
 import singer
 from singer import StateMessage
+from singer_sdk.exceptions import FatalAPIError
+from singer_sdk.helpers.jsonpath import extract_jsonpath
 from singer_sdk.streams import RESTStream
 
 from tap_easyecom.auth import BearerTokenAuthenticator
 from pendulum import parse
 import backoff
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import MaxRetryError
+from urllib3.util.retry import Retry
+
+# streams whose partition bookmarks are reset before emitting state
+RESET_PARTITIONS_STREAMS = frozenset({"gl_entries_dimensions"})
+
+
+class LoggingRetry(Retry):
+    """urllib3 Retry that reports every retry to an `on_retry` callback.
+
+    The callback gets the same details dict as a backoff `on_backoff` handler,
+    so the stream's `backoff_handler` keeps logging throttling and 5xx retries.
+    """
+
+    def __init__(self, *args, on_retry: Optional[Callable] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.on_retry = on_retry
+
+    def new(self, **kw):
+        kw.setdefault("on_retry", self.on_retry)
+        return super().new(**kw)
+
+    def increment(
+        self, method=None, url=None, response=None, error=None, *args, **kwargs
+    ):
+        new_retry = super().increment(
+            method, url, response, error, *args, **kwargs
+        )
+        if new_retry.on_retry:
+            new_retry.on_retry(
+                {
+                    "target": "urlopen",
+                    "args": (method, url),
+                    "kwargs": {
+                        "status": getattr(response, "status", None),
+                        "error": error,
+                    },
+                    "tries": len(new_retry.history),
+                    "wait": new_retry.get_backoff_time(),
+                }
+            )
+        return new_retry
+
+
+def _exhausted_in_adapter(ex: Exception) -> bool:
+    """Whether the error already went through the adapter's Retry policy."""
+    return bool(ex.args) and isinstance(ex.args[0], MaxRetryError)
+
+
+# retries are handled by urllib3 inside the connection pool
+RETRY_STRATEGY = LoggingRetry(
+    total=9,  # 10 attempts in all, like the old backoff max_tries
+    backoff_factor=0.5,
+    status_forcelist=[429, *range(500, 600)],
+    allowed_methods=frozenset(["GET", "POST"]),
+    raise_on_status=False,
+)
+
+
+class UnauthorizedAPIError(FatalAPIError):
+    """Raised when the API rejects the access token (HTTP 401)."""
+
 
 class EasyEcomStream(RESTStream):
     """EasyEcom stream class."""
@@ -18,31 +86,133 @@ class EasyEcomStream(RESTStream):
     records_jsonpath = "$.data[*]"
     # limit is maxed out at 10 :/
     page_size = 10
+    date_filter_param = "updated_after"
+    additional_params: dict = {}
+    # formatted start date filter, set on the first page of each pagination run
+    _start_date_param: Optional[str] = None
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        adapter = HTTPAdapter(
+            max_retries=RETRY_STRATEGY.new(on_retry=self.backoff_handler)
+        )
+        self.requests_session.mount("https://", adapter)
+        self.requests_session.mount("http://", adapter)
+
+    def _json(self, response: requests.Response) -> dict:
+        """Parse the response body once and memoize it on the response."""
+        res_json = getattr(response, "_cached_json", None)
+        if res_json is None:
+            res_json = orjson.loads(response.content)
+            response._cached_json = res_json
+        return res_json
 
     def get_next_page_token(
         self, response, previous_token
     ):
         """Return a token for identifying next page or None if no more pages."""
-        res_json = response.json()
+        res_json = self._json(response)
         next_url = res_json.get("nextUrl")
 
         if not next_url and isinstance(res_json.get("data", {}), dict):
             next_url = res_json.get("data", {}).get("nextUrl")
 
         if next_url:
-            return parse_qs(urlparse(next_url).query)['cursor']
+            return self._extract_cursor(next_url)
 
         return None
 
+    @staticmethod
+    def _extract_cursor(next_url: str):
+        """Pull the `cursor` query value out of nextUrl without a full URL parse."""
+        for sep in ("?cursor=", "&cursor="):
+            i = next_url.find(sep)
+            if i != -1:
+                break
+        else:
+            return None
+        cursor = next_url[i + len(sep):].split("&", 1)[0].split("#", 1)[0]
+        if "%" in cursor or "+" in cursor:
+            cursor = unquote_plus(cursor)
+        return cursor or None
+
+    @cached_property
+    def _records_path(self) -> Optional[tuple]:
+        """Keys of a plain `$.a.b[*]` records_jsonpath, None for anything else."""
+        match = re.fullmatch(r"\$((?:\.\w+)+)\[\*\]", self.records_jsonpath)
+        return tuple(match.group(1)[1:].split(".")) if match else None
+
+    def parse_response(self, response: requests.Response) -> Iterable[dict]:
+        """Parse the response and return an iterator of result records."""
+        res_json = self._json(response)
+        if self._records_path:
+            node = res_json
+            for key in self._records_path:
+                if not isinstance(node, dict):
+                    node = None
+                    break
+                node = node.get(key)
+            if isinstance(node, list):
+                yield from node
+                return
+        yield from extract_jsonpath(self.records_jsonpath, input=res_json)
+
+    def request_records(self, context: Optional[dict]) -> Iterable[dict]:
+        """Request records page by page, fetching the next page in the background.
+
+        The cursor for page K+1 is only known once page K arrives, so pages
+        can't be requested concurrently; instead the next request is sent while
+        the records of the current page are being processed downstream.
+
+        This mirrors the `request_records` loop of singer-sdk ~=0.9.0 (see the
+        pin in pyproject.toml); revisit it when upgrading the SDK, as later
+        versions drive pagination through paginator classes instead.
+        """
+        decorated_request = self.request_decorator(self._request)
+        next_page_token = None
+        executor = ThreadPoolExecutor(max_workers=1)
+        future = None
+        try:
+            prepared_request = self.prepare_request(context, next_page_token=None)
+            future = executor.submit(decorated_request, prepared_request, context)
+            while future:
+                resp = future.result()
+                future = None
+                self.update_sync_costs(prepared_request, resp, context)
+
+                previous_token = copy.copy(next_page_token)
+                next_page_token = self.get_next_page_token(
+                    response=resp, previous_token=previous_token
+                )
+                if next_page_token and next_page_token == previous_token:
+                    raise RuntimeError(
+                        f"Loop detected in pagination. "
+                        f"Pagination token {next_page_token} is identical to prior token."
+                    )
+
+                if next_page_token:
+                    prepared_request = self.prepare_request(
+                        context, next_page_token=next_page_token
+                    )
+                    future = executor.submit(
+                        decorated_request, prepared_request, context
+                    )
+
+                yield from self.parse_response(resp)
+        finally:
+            # on an early exit (generator closed, max records reached, downstream
+            # error) don't block until the prefetched page arrives
+            if future is not None:
+                future.cancel()
+            executor.shutdown(wait=False)
+
     @property
     def url_base(self) -> str:
         return "https://api.easyecom.io"
 
     @cached_property
     def authenticator(self) -> BearerTokenAuthenticator:
-        return BearerTokenAuthenticator(
-            self, self._tap.config, f"{self.url_base}/access/token"
-        )
+        return self._tap.get_authenticator(self)
 
     @property
     def http_headers(self) -> dict:
@@ -51,12 +221,16 @@ class EasyEcomStream(RESTStream):
             headers["User-Agent"] = self.config.get("user_agent")
         return headers
 
-    def get_starting_time(self, context):
+    @cached_property
+    def _parsed_start_date(self):
         start_date = self.config.get("start_date")
         if start_date:
-            start_date = parse(self.config.get("start_date"))
+            return parse(start_date)
+        return None
+
+    def get_starting_time(self, context):
         rep_key = self.get_starting_timestamp(context)
-        return rep_key or start_date
+        return rep_key or self._parsed_start_date
 
     def get_url_params(self,context,next_page_token):
         params: dict = {}
@@ -64,12 +238,14 @@ class EasyEcomStream(RESTStream):
             params["cursor"] = next_page_token
         if self.page_size:
             params["limit"] = self.page_size
-        if hasattr(self, "additional_params"):
-            params.update(self.additional_params)
+        params.update(self.additional_params)
         if self.replication_key:
-            start_date = self.get_starting_time(context)
-            date_filter = self.date_filter_param if hasattr(self, "date_filter_param") else "updated_after"
-            params[date_filter] = start_date.strftime('%Y-%m-%d %H:%M:%S')
+            # the start date is fixed for the whole pagination run, so only
+            # format it when a new run starts (first page) or it's not set yet
+            if not next_page_token or self._start_date_param is None:
+                start_date = self.get_starting_time(context)
+                self._start_date_param = start_date.strftime('%Y-%m-%d %H:%M:%S')
+            params[self.date_filter_param] = self._start_date_param
         return params
 
     def _write_state_message(self) -> None:
@@ -77,23 +253,43 @@ class EasyEcomStream(RESTStream):
         tap_state = self.tap_state
 
         if tap_state and tap_state.get("bookmarks"):
-            for stream_name in tap_state.get("bookmarks").keys():
-                if stream_name in [
-                    "gl_entries_dimensions",
-                ] and tap_state["bookmarks"][stream_name].get("partitions"):
-                    tap_state["bookmarks"][stream_name] = {"partitions": []}
+            bookmarks = tap_state["bookmarks"]
+            for stream_name in RESET_PARTITIONS_STREAMS.intersection(bookmarks):
+                if bookmarks[stream_name].get("partitions"):
+                    bookmarks[stream_name] = {"partitions": []}
 
         singer.write_message(StateMessage(value=tap_state))
 
+    def validate_response(self, response: requests.Response) -> None:
+        if response.status_code == 401:
+            raise UnauthorizedAPIError(self.response_error_message(response))
+        super().validate_response(response)
+
+    def _request(self, prepared_request, context):
+        try:
+            return super()._request(prepared_request, context)
+        except UnauthorizedAPIError:
+            sent_authorization = prepared_request.headers.get("Authorization")
+            if not self.authenticator.handle_unauthorized(sent_authorization):
+                raise
+            prepared_request.headers.update(self.authenticator.auth_headers)
+            return super()._request(prepared_request, context)
+
     def request_decorator(self, func: Callable) -> Callable:
+        """Retry errors raised while reading the body, after the adapter returned.
+
+        Status codes and connection/read errors up to the response headers are
+        retried by the HTTPAdapter; requests reads the body afterwards, so a
+        connection dropped or stalled mid-body never reaches the Retry policy.
+        """
         decorator: Callable = backoff.on_exception(
             self.backoff_wait_generator,
             (
-                RetriableAPIError,
-                requests.exceptions.ReadTimeout,
                 requests.exceptions.ConnectionError,
+                requests.exceptions.ChunkedEncodingError,
             ),
             max_tries=10,
+            giveup=_exhausted_in_adapter,
             on_backoff=self.backoff_handler,
         )(func)
-        return decorator
\ No newline at end of file
+        return decorator
@@ -1,16 +1,9 @@
 """Stream type classes for tap-easyecom."""
 
-from typing import Any, Dict, Iterable, Optional, List
 from singer_sdk import typing as th
 from tap_easyecom.client import EasyEcomStream
 from datetime import datetime, timedelta
 import pytz
-import copy
-from singer_sdk.exceptions import InvalidStreamSortException
-from singer_sdk.helpers._state import (
-    finalize_state_progress_markers,
-    log_sort_error,
-)
 
 
 class ProductsStream(EasyEcomStream):
@@ -340,8 +333,6 @@ class SellOrdersStream(EasyEcomStream):
 
     def get_next_page_token(self, response, previous_token):
         next_page_token = super().get_next_page_token(response, previous_token)
-        if next_page_token:
-            next_page_token = next_page_token[0]
         if not next_page_token and self.end_date and self.today and self.end_date < self.today:
             return f"iterate_{self.start_date}"
         return next_page_token
@@ -3,6 +3,7 @@
 from singer_sdk import Tap
 from singer_sdk import typing as th  # JSON schema typing helpers
 
+from tap_easyecom.auth import BearerTokenAuthenticator
 from tap_easyecom.streams import (
     ProductsStream,
     ProductCompositionsStream,
@@ -37,9 +38,18 @@ class TapEasyEcom(Tap):
         parse_env_config=False,
         validate_config=True,
     ) -> None:
+        self._authenticator = None
         super().__init__(config, catalog, state, parse_env_config, validate_config)
         self.config_file = config[0]
 
+    def get_authenticator(self, stream) -> BearerTokenAuthenticator:
+        """Return the authenticator shared by all streams, creating it on first use."""
+        if self._authenticator is None:
+            self._authenticator = BearerTokenAuthenticator(
+                stream, self.config_file, f"{stream.url_base}/access/token"
+            )
+        return self._authenticator
+
     # TODO: Update this section with the actual config values you expect:
     config_jsonschema = th.PropertiesList(
         th.Property("start_date", th.DateTimeType,),
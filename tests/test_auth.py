@@ -0,0 +1,65 @@
+"""Tests for the EasyEcom bearer token authenticator."""
+
+import json
+import tempfile
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from tap_easyecom.auth import BearerTokenAuthenticator
+
+
+@pytest.fixture
+def authenticator():
+    # only the token state used by handle_unauthorized is needed here
+    auth = BearerTokenAuthenticator.__new__(BearerTokenAuthenticator)
+    auth._cached_headers = {"Authorization": "Bearer old"}
+    auth._refresh_cooldown_until = 0.0
+    auth.refresh_count = 0
+
+    def update_access_token():
+        auth.refresh_count += 1
+        auth._cached_headers = {"Authorization": "Bearer new"}
+
+    auth.update_access_token = update_access_token
+    return auth
+
+
+def test_handle_unauthorized_token_already_rotated(authenticator):
+    authenticator._cached_headers = {"Authorization": "Bearer new"}
+
+    assert authenticator.handle_unauthorized("Bearer old") is True
+    assert authenticator.refresh_count == 0
+
+
+def test_handle_unauthorized_cooldown_active(authenticator):
+    authenticator._refresh_cooldown_until = time.monotonic() + 60
+
+    assert authenticator.handle_unauthorized("Bearer old") is False
+    assert authenticator.refresh_count == 0
+
+
+def test_handle_unauthorized_refreshes_then_retries(authenticator):
+    assert authenticator.handle_unauthorized("Bearer old") is True
+    assert authenticator.refresh_count == 1
+    assert authenticator._cached_headers["Authorization"] == "Bearer new"
+
+    # a second 401 with the fresh token inside the cooldown is not refreshed again
+    assert authenticator.handle_unauthorized("Bearer new") is False
+    assert authenticator.refresh_count == 1
+
+
+def test_write_config_in_place_when_directory_is_read_only(tmp_path, monkeypatch):
+    config_file = tmp_path / "config.json"
+    config_file.write_text("{}")
+    auth = BearerTokenAuthenticator.__new__(BearerTokenAuthenticator)
+    auth._tap = SimpleNamespace(config_file=str(config_file), _config={"access_token": "x"})
+
+    def read_only_dir(*args, **kwargs):
+        raise PermissionError("read-only directory")
+
+    monkeypatch.setattr(tempfile, "mkstemp", read_only_dir)
+    auth._write_config()
+
+    assert json.loads(config_file.read_text()) == {"access_token": "x"}
@@ -0,0 +1,133 @@
+"""Tests for the EasyEcomStream base class."""
+
+import json
+import time
+from datetime import datetime
+
+import backoff
+import pytest
+import requests
+from singer_sdk.helpers.jsonpath import extract_jsonpath
+from urllib3.exceptions import MaxRetryError, ReadTimeoutError
+from urllib3.response import HTTPResponse
+
+from tap_easyecom.client import RETRY_STRATEGY, UnauthorizedAPIError
+from tap_easyecom.streams import ProductsStream, SellOrdersStream
+
+
+def make_response(body) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response._content = json.dumps(body).encode()
+    return response
+
+
+@pytest.mark.parametrize("stream_class", [ProductsStream, SellOrdersStream])
+@pytest.mark.parametrize(
+    "body",
+    [
+        {"data": [{"id": 1}, {"id": 2}]},
+        {"data": {"id": 1}},
+        {"data": {"orders": [{"id": 1}, {"id": 2}]}},
+        {"data": {"orders": {"id": 1}}},
+        {"data": "No data found"},
+        {"message": "No data found"},
+    ],
+)
+def test_parse_response_matches_jsonpath(stream_class, body):
+    # parse_response doesn't touch the tap, so skip building one
+    stream = stream_class.__new__(stream_class)
+    expected = list(extract_jsonpath(stream.records_jsonpath, input=body))
+
+    assert list(stream.parse_response(make_response(body))) == expected
+
+
+def test_validate_response_401_keeps_error_details():
+    stream = ProductsStream.__new__(ProductsStream)
+    response = make_response({})
+    response.status_code = 401
+    response.reason = "Unauthorized"
+
+    with pytest.raises(UnauthorizedAPIError, match="401 Client Error: Unauthorized"):
+        stream.validate_response(response)
+
+
+def test_get_url_params_with_token_before_first_page():
+    stream = ProductsStream.__new__(ProductsStream)
+    stream.get_starting_time = lambda context: datetime(2024, 1, 2, 3, 4, 5)
+
+    params = stream.get_url_params(None, "abc")
+
+    assert params["cursor"] == "abc"
+    assert params["updated_after"] == "2024-01-02 03:04:05"
+
+
+def make_flaky(errors):
+    calls = []
+
+    def request():
+        calls.append(1)
+        if len(calls) <= len(errors):
+            raise errors[len(calls) - 1]
+        return "ok"
+
+    return request, calls
+
+
+def test_request_decorator_retries_body_read_errors():
+    stream = ProductsStream.__new__(ProductsStream)
+    stream.backoff_wait_generator = lambda: backoff.constant(0)
+    request, calls = make_flaky(
+        [
+            requests.exceptions.ChunkedEncodingError("connection dropped"),
+            requests.exceptions.ConnectionError(ReadTimeoutError(None, "/", "stalled")),
+        ]
+    )
+
+    assert stream.request_decorator(request)() == "ok"
+    assert len(calls) == 3
+
+
+def test_request_decorator_skips_errors_retried_by_adapter():
+    stream = ProductsStream.__new__(ProductsStream)
+    stream.backoff_wait_generator = lambda: backoff.constant(0)
+    request, calls = make_flaky(
+        [requests.exceptions.ConnectionError(MaxRetryError(None, "/"))]
+    )
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        stream.request_decorator(request)()
+    assert len(calls) == 1
+
+
+def test_retry_strategy_reports_retries():
+    retries = []
+    retry = RETRY_STRATEGY.new(on_retry=retries.append)
+
+    retry = retry.increment("GET", "/", response=HTTPResponse(status=503))
+    retry.increment("GET", "/", response=HTTPResponse(status=429))
+
+    assert [(r["tries"], r["kwargs"]["status"]) for r in retries] == [(1, 503), (2, 429)]
+
+
+def test_request_records_early_exit_does_not_wait_for_prefetch():
+    stream = ProductsStream.__new__(ProductsStream)
+    stream.request_decorator = lambda func: func
+    stream.prepare_request = lambda context, next_page_token: next_page_token or 0
+    stream.update_sync_costs = lambda *args: None
+    stream.get_next_page_token = lambda response, previous_token: response + 1
+
+    def slow_request(page, context):
+        if page:
+            time.sleep(2)
+        return page
+
+    stream._request = slow_request
+    stream.parse_response = lambda page: iter([{"page": page}])
+
+    records = stream.request_records(None)
+    assert next(records) == {"page": 0}
+
+    started = time.monotonic()
+    records.close()
+    assert time.monotonic() - started < 1